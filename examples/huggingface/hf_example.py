@@ -1,9 +1,13 @@
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 import torch
+from datasets import Dataset
 from optimum.onnxruntime.configuration import AutoQuantizationConfig
 from sklearn.model_selection import train_test_split
 from transformers import (
@@ -26,23 +30,75 @@ from opsml import (
     TextDataset,
 )
 
+# let the rust tokenizer use its thread pool for batch encoding
+os.environ["TOKENIZERS_PARALLELISM"] = "true"
+
+MAX_LENGTH = 128
+CALIBRATION_SIZE = 64
+
+
+def _cpu_flags() -> List[str]:
+    """Reads cpu flags from /proc/cpuinfo (linux only)"""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as file_:
+            for line in file_:
+                if line.startswith("flags"):
+                    return line.split(":", 1)[1].split()
+    except OSError:
+        pass
+    return []
+
+
+def get_quantization_config(quant_target: Optional[str] = None) -> AutoQuantizationConfig:
+    """Selects a static, per-channel quantization config for the current cpu.
+
+    int8 kernels built for avx512_vnni are much slower on cpus without vnni, so
+    fall back to avx512 or avx2 (with reduce_range to avoid accumulator overflow).
+    Static configs require a calibration dataset (see `HuggingFaceOnnxArgs`).
+
+    Args:
+        quant_target:
+            Optional override. One of "avx512_vnni", "avx512" or "avx2"
+    """
+    if quant_target is None:
+        flags = _cpu_flags()
+        if "avx512_vnni" in flags:
+            quant_target = "avx512_vnni"
+        elif "avx512f" in flags:
+            quant_target = "avx512"
+        else:
+            quant_target = "avx2"
+
+    if quant_target == "avx512_vnni":
+        return AutoQuantizationConfig.avx512_vnni(is_static=True, per_channel=True, reduce_range=False)
+    if quant_target == "avx512":
+        return AutoQuantizationConfig.avx512(is_static=True, per_channel=True, reduce_range=True)
+    if quant_target == "avx2":
+        return AutoQuantizationConfig.avx2(is_static=True, per_channel=True, reduce_range=True)
+
+    raise ValueError(f"Unsupported quantization target: {quant_target}")
+
 
 class ExampleDataset(torch.utils.data.Dataset):
     def __init__(self, encodings, labels):
-        self.encodings = encodings
-        self.labels = labels
+        # build contiguous tensors once so __getitem__ only returns views (no per-item allocation)
+        self.input_ids = torch.as_tensor(np.asarray(encodings["input_ids"]), dtype=torch.long)
+        self.attention_mask = torch.as_tensor(np.asarray(encodings["attention_mask"]), dtype=torch.long)
+        self.labels = torch.as_tensor(np.asarray(labels), dtype=torch.long)
 
     def __getitem__(self, idx):
-        item = {key: torch.tensor(val[idx]) for key, val in self.encodings.items()}  # pylint: disable=no-member
-        item["labels"] = torch.tensor(self.labels[idx])  # pylint: disable=no-member
-        return item
+        return {
+            "input_ids": self.input_ids[idx],
+            "attention_mask": self.attention_mask[idx],
+            "labels": self.labels[idx],
+        }
 
     def __len__(self):
         return len(self.labels)
 
 
 class OpsmlHuggingFaceWorkflow:
-    def __init__(self, info: CardInfo):
+    def __init__(self, info: CardInfo, quant_target: Optional[str] = None):
         """Instantiates workflow class. Instantiation will also set up the registries that
         will be used to store cards and artifacts
 
@@ -51,9 +107,13 @@ class OpsmlHuggingFaceWorkflow:
                 CardInfo data structure that contains required info for cards.
                 You could also provide "name", "repository" and "email" to a card; however, this
                 simplifies the process.
+            quant_target:
+                Optional instruction set to quantize for ("avx512_vnni", "avx512" or "avx2").
+                Detected from the current cpu if not provided.
 
         """
         self.info = info
+        self.quant_target = quant_target
         self.registries = CardRegistries()
 
     def _create_datacard(self):
@@ -75,14 +135,14 @@ class OpsmlHuggingFaceWorkflow:
     def _get_data(self, dir_path: Path) -> Tuple[List[str], List[int]]:
         """Loads records in path and splits between text and labels"""
 
-        texts = []
-        labels = []
-        for text_file in (dir_path).rglob("*.txt"):
-            with open(text_file, "r", encoding="utf-8") as file_:
-                record_str = file_.read()
-                record = json.loads(record_str)
-                texts.append(record["text"])
-                labels.append(record["label"])
+        files = list(dir_path.rglob("*.txt"))
+
+        # reads are I/O bound, so overlap them across threads
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            records = list(executor.map(lambda text_file: json.loads(text_file.read_bytes()), files))
+
+        texts = [record["text"] for record in records]
+        labels = [record["label"] for record in records]
 
         return texts, labels
 
@@ -102,8 +162,21 @@ class OpsmlHuggingFaceWorkflow:
         # get tokenizer
         tokenizer = DistilBertTokenizerFast.from_pretrained("distilbert-base-uncased")
 
-        train_encodings = tokenizer(train_texts, truncation=True, padding=True)
-        val_encodings = tokenizer(val_texts, truncation=True, padding=True)
+        # batch encode with fixed length; fast tokenizers dispatch to the rust encode_batch
+        train_encodings = tokenizer(
+            train_texts,
+            truncation=True,
+            padding="max_length",
+            max_length=MAX_LENGTH,
+            return_tensors="np",
+        )
+        val_encodings = tokenizer(
+            val_texts,
+            truncation=True,
+            padding="max_length",
+            max_length=MAX_LENGTH,
+            return_tensors="np",
+        )
 
         train_dataset = ExampleDataset(train_encodings, train_labels)
         val_dataset = ExampleDataset(val_encodings, val_labels)
@@ -117,6 +190,10 @@ class OpsmlHuggingFaceWorkflow:
             weight_decay=0.01,
             logging_dir="mlruns/logs",
             logging_steps=10,
+            dataloader_num_workers=4,
+            dataloader_pin_memory=True,
+            dataloader_persistent_workers=True,
+            dataloader_prefetch_factor=2,
         )
 
         model = DistilBertForSequenceClassification.from_pretrained("distilbert-base-uncased")
@@ -132,6 +209,19 @@ class OpsmlHuggingFaceWorkflow:
 
         inputs = tokenizer(train_texts[0], return_tensors="pt", padding="max_length", truncation=True)
 
+        # small calibration set for static quantization. Tokenized in-process: forking map
+        # workers after the rust tokenizer has been used can deadlock
+        calibration_dataset = Dataset.from_dict({"text": val_texts[:CALIBRATION_SIZE]}).map(
+            lambda batch: tokenizer(
+                batch["text"],
+                truncation=True,
+                padding="max_length",
+                max_length=MAX_LENGTH,
+            ),
+            batched=True,
+            remove_columns=["text"],
+        )
+
         interface = HuggingFaceModel(
             model=trainer.model,
             sample_data=inputs,
@@ -140,7 +230,8 @@ class OpsmlHuggingFaceWorkflow:
             onnx_args=HuggingFaceOnnxArgs(
                 ort_type=HuggingFaceORTModel.ORT_SEQUENCE_CLASSIFICATION.value,
                 quantize=True,
-                config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+                config=get_quantization_config(self.quant_target),
+                calibration_dataset=calibration_dataset,
             ),
         )
 
@@ -3,6 +3,7 @@
 # LICENSE file in the root directory of this source tree.
 
 from pathlib import Path
+from typing import List
 
 from fastapi import HTTPException, Request, status
 
@@ -87,8 +88,27 @@ def reverse_swap_opsml_root(request: Request, path: Path) -> Path:
 
     _verify_path(path)
 
-    if not path.as_posix().startswith(config.opsml_proxy_root):
-        curr_path = path
-        new_path = Path(config.opsml_proxy_root) / curr_path.relative_to(request.app.state.storage_root)
-        return new_path
-    return path
+    return reverse_swap_opsml_roots(request, [path])[0]
+
+
+def reverse_swap_opsml_roots(request: Request, paths: List[Path]) -> List[Path]:
+    """Batch version of `reverse_swap_opsml_root` for paths listed from an already
+    verified (swapped) directory. Roots are resolved once and paths are not re-verified.
+
+    Args:
+        request:
+            Request object
+        paths:
+            paths to swap
+
+    Returns:
+        new paths
+    """
+    proxy_root = config.opsml_proxy_root
+    proxy_path = Path(proxy_root)
+    storage_root = request.app.state.storage_root
+
+    return [
+        path if path.as_posix().startswith(proxy_root) else proxy_path / path.relative_to(storage_root)
+        for path in paths
+    ]
@@ -8,11 +8,13 @@ from typing import Any, AsyncGenerator, Awaitable, Callable, Union
 
 from fastapi import FastAPI, Response
 
+from opsml.app.routes.pydantic_models import DebugResponse
 from opsml.helpers.logging import ArtifactLogger
 from opsml.model.registrar import ModelRegistrar
 from opsml.registry.registry import CardRegistries
 from opsml.settings.config import config
 from opsml.storage import client
+from opsml.types import RegistryTableNames, RegistryType
 
 logger = ArtifactLogger.get_logger()
 
@@ -35,13 +37,26 @@ def _init_rollbar() -> None:
 
 def _init_registries(app: FastAPI) -> None:
     app.state.registries = CardRegistries()
+    app.state.registry_by_table = {
+        RegistryTableNames[registry_type.name].value: getattr(app.state.registries, registry_type.value)
+        for registry_type in RegistryType
+    }
     app.state.storage_client = client.storage_client
     app.state.model_registrar = ModelRegistrar(client.storage_client)
     app.state.storage_root = config.storage_root
 
 
+def _init_debug_response(app: FastAPI) -> None:
+    app.state.debug_response = DebugResponse(
+        url=config.opsml_tracking_uri,
+        storage=config.opsml_storage_uri,
+        app_env=config.app_env,
+    )
+
+
 def _shutdown_registries(app: FastAPI) -> None:
     app.state.registries = None
+    app.state.registry_by_table = None
     # app.state.storage_client = None
     # app.state.model_registrar = None
 
@@ -57,6 +72,7 @@ def start_app_handler(app: FastAPI) -> Callable[[], None]:
         _log_url_and_storage()
         _init_rollbar()
         _init_registries(app=app)
+        _init_debug_response(app=app)
 
     return startup
 
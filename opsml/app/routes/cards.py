@@ -2,9 +2,12 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Type, TypeVar, Union
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
 
 from opsml.app.core.dependencies import verify_token
 from opsml.app.routes.pydantic_models import (
@@ -23,7 +26,7 @@ from opsml.app.routes.pydantic_models import (
     VersionRequest,
     VersionResponse,
 )
-from opsml.app.routes.utils import get_registry_type_from_table
+from opsml.app.routes.utils import get_registry_from_table
 from opsml.helpers.logging import ArtifactLogger
 from opsml.registry import CardRegistry
 
@@ -32,6 +35,38 @@ logger = ArtifactLogger.get_logger()
 router = APIRouter()
 
 
+PayloadT = TypeVar("PayloadT", bound=BaseModel)
+
+
+def _validate_json_body(model: Type[PayloadT], body: bytes) -> PayloadT:
+    """Validates the raw request body in pydantic-core (no intermediate json.loads).
+    Error locations are prefixed with "body" to match FastAPI body validation"""
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as error:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in error.errors(include_url=False)]
+        ) from error
+
+
+def _json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for payloads read in a dependency rather than declared with Body"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
+
+async def add_card_payload(request: Request) -> AddCardRequest:
+    return _validate_json_body(AddCardRequest, await request.body())
+
+
+async def update_card_payload(request: Request) -> UpdateCardRequest:
+    return _validate_json_body(UpdateCardRequest, await request.body())
+
+
 @router.post("/cards/uid", response_model=UidExistsResponse, name="check_uid")
 def check_uid(
     request: Request,
@@ -39,13 +74,12 @@ def check_uid(
 ) -> UidExistsResponse:
     """Checks if a uid already exists in the database"""
 
-    registry_type = get_registry_type_from_table(
+    registry = get_registry_from_table(
+        request=request,
         table_name=payload.table_name,
         registry_type=payload.registry_type,
     )
 
-    registry: CardRegistry = getattr(request.app.state.registries, registry_type)
-
     if registry._registry.check_uid(
         uid=payload.uid,
         registry_type=registry.registry_type,
@@ -114,13 +148,12 @@ def set_version(
 ) -> Union[VersionResponse, UidExistsResponse]:
     """Sets the version for an artifact card"""
 
-    registry_type = get_registry_type_from_table(
+    registry = get_registry_from_table(
+        request=request,
         table_name=payload.table_name,
         registry_type=payload.registry_type,
     )
 
-    registry: CardRegistry = getattr(request.app.state.registries, registry_type)
-
     try:
         version = registry._registry.set_version(
             name=payload.name,
@@ -143,16 +176,19 @@ def set_version(
 def list_cards(
     request: Request,
     payload: ListCardRequest = Body(...),
-) -> ListCardResponse:
-    """Lists a Card"""
+) -> JSONResponse:
+    """Lists a Card.
+
+    Records are json-native (str, int, json columns), so they are returned directly
+    to skip response model validation and encoding of potentially large listings.
+    """
 
     try:
-        registry_type = get_registry_type_from_table(
+        registry = get_registry_from_table(
+            request=request,
             table_name=payload.table_name,
             registry_type=payload.registry_type,
         )
-
-        registry: CardRegistry = getattr(request.app.state.registries, registry_type)
         logger.info("Listing cards with request: {}", payload.model_dump())
 
         cards = registry._registry.list_cards(
@@ -167,7 +203,7 @@ def list_cards(
             query_terms=payload.query_terms,
         )
 
-        return ListCardResponse(cards=cards)
+        return JSONResponse({"cards": cards})
 
     except Exception as error:
         raise HTTPException(
@@ -181,21 +217,21 @@ def list_cards(
     response_model=AddCardResponse,
     name="create_card",
     dependencies=[Depends(verify_token)],
+    openapi_extra=_json_body_openapi(AddCardRequest),
 )
 def create_card(
     request: Request,
-    payload: AddCardRequest = Body(...),
+    payload: AddCardRequest = Depends(add_card_payload),
 ) -> AddCardResponse:
     """Adds Card record to a registry"""
 
     try:
-        registry_type = get_registry_type_from_table(
+        registry = get_registry_from_table(
+            request=request,
             table_name=payload.table_name,
             registry_type=payload.registry_type,
         )
 
-        registry: CardRegistry = getattr(request.app.state.registries, registry_type)
-
         logger.info("Creating card: {}", payload.model_dump())
 
         registry._registry.add_and_commit(card=payload.card)
@@ -213,19 +249,20 @@ def create_card(
     response_model=UpdateCardResponse,
     name="update_card",
     dependencies=[Depends(verify_token)],
+    openapi_extra=_json_body_openapi(UpdateCardRequest),
 )
 def update_card(
     request: Request,
-    payload: UpdateCardRequest = Body(...),
+    payload: UpdateCardRequest = Depends(update_card_payload),
 ) -> UpdateCardResponse:
     """Updates a specific artifact card"""
 
     try:
-        registry_type = get_registry_type_from_table(
+        registry = get_registry_from_table(
+            request=request,
             table_name=payload.table_name,
             registry_type=payload.registry_type,
         )
-        registry: CardRegistry = getattr(request.app.state.registries, registry_type)
         registry._registry.update_card_record(card=payload.card)
 
         logger.info("Updated card: {}", payload.model_dump())
@@ -252,11 +289,11 @@ def delete_card(
     """Deletes a specific artifact card"""
 
     try:
-        registry_type = get_registry_type_from_table(
+        registry = get_registry_from_table(
+            request=request,
             table_name=payload.table_name,
             registry_type=payload.registry_type,
         )
-        registry: CardRegistry = getattr(request.app.state.registries, registry_type)
         registry._registry.delete_card_record(card=payload.card)
 
         # check that deletion was successful
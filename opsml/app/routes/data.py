@@ -5,8 +5,8 @@
 from pathlib import Path
 from typing import Optional, cast
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
 from opsml.app.routes.files import download_artifacts_ui, download_file
@@ -78,7 +78,7 @@ async def data_versions_uid_page(request: Request, uid: str) -> HTMLResponse:
 
 
 @router.get("/data/download", name="download_data")
-def download_data(request: Request, uid: str) -> StreamingResponse:
+def download_data(request: Request, uid: str) -> Response:
     """Downloads data associated with a datacard"""
 
     registry: CardRegistry = request.app.state.registries.data
@@ -91,7 +91,7 @@ def download_data(request: Request, uid: str) -> StreamingResponse:
 def download_data_profile(
     request: Request,
     uid: str,
-) -> StreamingResponse:
+) -> Response:
     """Downloads a datacard profile"""
 
     registry: CardRegistry = request.app.state.registries.data
@@ -9,14 +9,14 @@ from pathlib import Path
 from typing import Dict
 
 import streaming_form_data
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from starlette.requests import ClientDisconnect
 from streaming_form_data import StreamingFormDataParser
 from streaming_form_data.validators import MaxSizeValidator
 
 from opsml.app.core.dependencies import (
-    reverse_swap_opsml_root,
+    reverse_swap_opsml_roots,
     swap_opsml_root,
     verify_token,
 )
@@ -32,7 +32,7 @@ from opsml.app.routes.utils import (
 )
 from opsml.helpers.logging import ArtifactLogger
 from opsml.settings.config import config
-from opsml.storage.client import StorageClientBase
+from opsml.storage.client import LocalStorageClient, StorageClientBase
 
 logger = ArtifactLogger.get_logger()
 
@@ -102,7 +102,7 @@ async def upload_file(request: Request) -> Dict[str, str]:  # pragma: no cover
 
 
 @router.get("/files/download", name="download_file")
-def download_file(request: Request, path: str) -> StreamingResponse:
+def download_file(request: Request, path: str) -> Response:
     """Downloads a file
 
     Args:
@@ -112,16 +112,22 @@ def download_file(request: Request, path: str) -> StreamingResponse:
             path to file
 
     Returns:
-        Streaming file response
+        File response for local storage (sent via sendfile), otherwise streaming file response
     """
     logger.info("Server: Downloading file {}", path)
     storage_client: StorageClientBase = request.app.state.storage_client
     try:
+        read_path = Path(swap_opsml_root(request, Path(path)))
+
+        if isinstance(storage_client, LocalStorageClient):
+            return FileResponse(
+                read_path,
+                media_type="application/octet-stream",
+                filename=read_path.name,
+            )
+
         return StreamingResponse(
-            storage_client.iterfile(
-                Path(swap_opsml_root(request, Path(path))),
-                config.download_chunk_size,
-            ),
+            storage_client.iterfile(read_path, config.download_chunk_size),
             media_type="application/octet-stream",
         )
 
@@ -180,7 +186,7 @@ def download_dir(request: Request, path: Path) -> StreamingResponse:
 
 
 @router.get("/files/download/ui", name="download_artifacts")
-def download_artifacts_ui(request: Request, path: str) -> StreamingResponse:
+def download_artifacts_ui(request: Request, path: str) -> Response:
     """Downloads a file
 
     Args:
@@ -197,8 +203,8 @@ def download_artifacts_ui(request: Request, path: str) -> StreamingResponse:
     return download_file(request, path)
 
 
-@router.get("/files/list", name="list_files")
-def list_files(request: Request, path: str) -> ListFileResponse:
+@router.get("/files/list", response_model=ListFileResponse, name="list_files")
+def list_files(request: Request, path: str) -> JSONResponse:
     """Lists files
 
     Args:
@@ -208,7 +214,7 @@ def list_files(request: Request, path: str) -> ListFileResponse:
             path to read
 
     Returns:
-        `ListFileResponse`
+        `ListFileResponse` payload
     """
 
     swapped_path = swap_opsml_root(request, Path(path))
@@ -216,7 +222,7 @@ def list_files(request: Request, path: str) -> ListFileResponse:
     files = storage_client.find(Path(swapped_path))
 
     try:
-        return ListFileResponse(files=[str(reverse_swap_opsml_root(request, Path(file_))) for file_ in files])
+        return JSONResponse({"files": [str(file_) for file_ in reverse_swap_opsml_roots(request, files)]})
 
     except Exception as error:
         raise HTTPException(
@@ -1,10 +1,9 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from opsml.app.routes.pydantic_models import DebugResponse, HealthCheckResult
-from opsml.settings.config import config
 
 router = APIRouter()
 
@@ -15,12 +14,10 @@ def get_healthcheck() -> HealthCheckResult:
 
 
 @router.get("/debug", response_model=DebugResponse, name="debug")
-async def debug() -> DebugResponse:
-    return DebugResponse(
-        url=config.opsml_tracking_uri,
-        storage=config.opsml_storage_uri,
-        app_env=config.app_env,
-    )
+async def debug(request: Request) -> DebugResponse:
+    # built once at app startup; config does not change at runtime
+    debug_response: DebugResponse = request.app.state.debug_response
+    return debug_response
 
 
 @router.get(
@@ -159,6 +159,30 @@ def get_registry_type_from_table(
     raise ValueError("Could not determine registry type")
 
 
+def get_registry_from_table(
+    request: Request,
+    table_name: Optional[str] = None,
+    registry_type: Optional[str] = None,
+) -> CardRegistry:
+    """Returns the registry for a table name or registry type.
+
+    Exact table names are resolved from the map built at app startup. Anything else
+    falls back to `get_registry_type_from_table`.
+    """
+    if table_name is not None:
+        registry: Optional[CardRegistry] = request.app.state.registry_by_table.get(table_name)
+        if registry is not None:
+            return registry
+
+    return cast(
+        CardRegistry,
+        getattr(
+            request.app.state.registries,
+            get_registry_type_from_table(table_name=table_name, registry_type=registry_type),
+        ),
+    )
+
+
 class MaxBodySizeException(Exception):
     def __init__(self, body_len: int):
         self.body_len = body_len
@@ -169,7 +193,7 @@ class MaxBodySizeValidator:
         self.body_len = 0
         self.max_size = max_size
 
-    def __call__(self, chunk: bytes) -> None:
+    def __call__(self, chunk: Union[bytes, bytearray, memoryview]) -> None:
         self.body_len += len(chunk)
         if self.body_len > self.max_size:
             raise MaxBodySizeException(body_len=self.body_len)
@@ -3,7 +3,9 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import copy
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, cast
 
 import yaml
@@ -26,6 +28,16 @@ DIR_PATH = os.path.dirname(__file__)
 AUDIT_TEMPLATE_PATH = os.path.join(DIR_PATH, "templates/audit_card.yaml")
 
 
+@lru_cache(maxsize=1)
+def _load_audit_template() -> AuditSectionType:
+    with open(AUDIT_TEMPLATE_PATH, "r", encoding="utf-8") as stream:
+        try:
+            audit_sections = cast(AuditSectionType, yaml.safe_load(stream))
+        except yaml.YAMLError as exc:
+            raise exc
+    return audit_sections
+
+
 # create new python class that inherits from ArtifactCard and is called AuditCard
 class Question(BaseModel):
     question: str
@@ -55,12 +67,8 @@ class AuditSections(BaseModel):
 
     @staticmethod
     def load_yaml_template() -> AuditSectionType:
-        with open(AUDIT_TEMPLATE_PATH, "r", encoding="utf-8") as stream:
-            try:
-                audit_sections = cast(AuditSectionType, yaml.safe_load(stream))
-            except yaml.YAMLError as exc:
-                raise exc
-        return audit_sections
+        # template is parsed once per process; callers get their own copy
+        return copy.deepcopy(_load_audit_template())
 
 
 class AuditQuestionTable:
@@ -22,6 +22,7 @@ class ArtifactCard(BaseModel):
         arbitrary_types_allowed=True,
         validate_assignment=False,
         validate_default=True,
+        defer_build=True,
     )
 
     name: str = CommonKwargs.UNDEFINED.value
@@ -109,8 +109,10 @@ class DataCard(ArtifactCard):
             Returns:
             Registry metadata
         """
-        exclude_attr = {"data"}
-        return self.model_dump(exclude=exclude_attr)
+        # DataRegistryRecord only reads card info and metadata, so only dump those
+        # rather than the interface (data, splits, feature map, dataset records)
+        include_attr = {"name", "repository", "contact", "uid", "version", "tags", "metadata"}
+        return self.model_dump(include=include_attr)
 
     def add_info(self, info: Dict[str, Union[float, int, str]]) -> None:
         """
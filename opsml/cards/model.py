@@ -121,8 +121,19 @@ class ModelCard(ArtifactCard):
     def create_registry_record(self) -> Dict[str, Any]:
         """Creates a registry record from the current ModelCard"""
 
-        exclude_vars = {"interface": {"model", "preprocessor", "sample_data", "onnx_model"}}
-        dumped_model = self.model_dump(exclude=exclude_vars)
+        # ModelRegistryRecord only needs card info, metadata and the interface model type
+        include_vars: Dict[str, Any] = {
+            "name": True,
+            "repository": True,
+            "contact": True,
+            "uid": True,
+            "version": True,
+            "tags": True,
+            "datacard_uid": True,
+            "metadata": True,
+            "interface": {"model_type"},
+        }
+        dumped_model = self.model_dump(include=include_vars)
 
         return dumped_model
 
@@ -59,12 +59,11 @@ class PipelineCard(ArtifactCard):
                 Card type. Accepted values are "data", "model", "run"
         """
         card_type = card_type.lower()
-        if card_type.lower() not in [CardType.DATACARD.value, CardType.RUNCARD.value, CardType.MODELCARD.value]:
+        if card_type not in {CardType.DATACARD.value, CardType.RUNCARD.value, CardType.MODELCARD.value}:
             raise ValueError("""Only 'model', 'run' and 'data' are allowed values for card_type""")
 
-        current_ids = getattr(self, f"{card_type}card_uids")
-        new_ids = [*current_ids, *[uid]]
-        setattr(self, f"{card_type}card_uids", new_ids)
+        # pydantic copies list defaults per instance, so append in place
+        getattr(self, f"{card_type}card_uids").append(uid)
 
     def load_pipeline_code(self) -> None:
         raise NotImplementedError
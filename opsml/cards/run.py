@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union, cast
 import joblib
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import model_validator
+from pydantic import TypeAdapter, model_validator
 
 from opsml.cards.base import ArtifactCard
 from opsml.helpers.logging import ArtifactLogger
@@ -40,6 +40,9 @@ from opsml.types import (
 
 logger = ArtifactLogger.get_logger()
 
+# built once so registry metric rows are validated in a single call
+_METRIC_LIST_ADAPTER = TypeAdapter(List[Metric])
+
 _List = List[Union[float, int]]
 _Dict = Dict[str, List[Union[float, int]]]
 _YReturn = Union[_List, _Dict]
@@ -479,7 +482,7 @@ class RunCard(ArtifactCard):
             _metric = self._registry.get_metric(run_uid=self.uid, name=[_key])
 
             if _metric is not None:
-                metric = [Metric(**i) for i in _metric]
+                metric = _METRIC_LIST_ADAPTER.validate_python(_metric)
 
             else:
                 raise ValueError(f"Metric {metric} was not defined")
@@ -502,8 +505,7 @@ class RunCard(ArtifactCard):
 
         # reset metrics
         self.metrics = {}
-        for metric in metrics:
-            _metric = Metric(**metric)
+        for _metric in _METRIC_LIST_ADAPTER.validate_python(metrics):
             if _metric.name not in self.metrics:
                 self.metrics[_metric.name] = [_metric]
             else:
@@ -1,7 +1,7 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
-from typing import Any, Dict, Union, cast
+from typing import Any, Dict, Type, Union, cast
 
 import pandas as pd
 import polars as pl
@@ -26,11 +26,6 @@ class SchemaValidator:
         """Converts data to pyarrow"""
         raise NotImplementedError
 
-    @staticmethod
-    def validate_data(data_type: str) -> bool:
-        """Validate data to formatter"""
-        raise NotImplementedError
-
 
 class PolarsSchemaValidator(SchemaValidator):
     def __init__(
@@ -58,10 +53,6 @@ class PolarsSchemaValidator(SchemaValidator):
 
         return cast(pl.DataFrame, self.data)
 
-    @staticmethod
-    def validate_data(data_type: str) -> bool:
-        return AllowedDataType.POLARS == data_type
-
 
 class PandasSchemaValidator(SchemaValidator):
     def __init__(
@@ -87,9 +78,11 @@ class PandasSchemaValidator(SchemaValidator):
 
         return cast(pd.DataFrame, self.data)
 
-    @staticmethod
-    def validate_data(data_type: str) -> bool:
-        return AllowedDataType.PANDAS == data_type
+
+_SCHEMA_VALIDATORS: Dict[str, Type[SchemaValidator]] = {
+    AllowedDataType.POLARS.value: PolarsSchemaValidator,
+    AllowedDataType.PANDAS.value: PandasSchemaValidator,
+}
 
 
 def check_data_schema(
@@ -107,16 +100,7 @@ def check_data_schema(
         data_type:
             Data type of data
     """
-    validator = next(
-        (
-            validator
-            for validator in SchemaValidator.__subclasses__()
-            if validator.validate_data(
-                data_type=data_type,
-            )
-        ),
-        None,
-    )
+    validator = _SCHEMA_VALIDATORS.get(data_type)
 
     if validator is None:
         return data
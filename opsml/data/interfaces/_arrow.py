@@ -1,10 +1,12 @@
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-from opsml.data.interfaces._base import DataInterface
+from opsml.data.interfaces._base import PARQUET_WRITE_OPTIONS, DataInterface
+from opsml.data.splitter import Data
 from opsml.types import AllowedDataType, Feature, Suffix
 
 
@@ -35,22 +37,50 @@ class ArrowData(DataInterface):
         """Saves pandas dataframe to parquet"""
 
         assert self.data is not None, "No data detected in interface"
-        schema = self.data.schema
+        # iterate schema fields directly rather than materializing names/types lists
         self.feature_map = {
-            feature: Feature(
-                feature_type=str(type_),
+            field.name: Feature(
+                feature_type=str(field.type),
                 shape=(1,),
             )
-            for feature, type_ in zip(schema.names, schema.types)
+            for field in self.data.schema
         }
 
-        pq.write_table(self.data, path)
+        pq.write_table(self.data, path, **PARQUET_WRITE_OPTIONS)
+
+    def split_data(self) -> Dict[str, Data]:
+        """Splits data interface according to data split logic. When every split is
+        index based, rows for all splits are gathered with a single take and
+        sliced back out per split (zero-copy).
+
+        Returns
+            Class containing data splits
+        """
+        data_splits = self.data_splits
+        if self.data is None or not data_splits:
+            return super().split_data()
+
+        split_indices = []
+        for data_split in data_splits:
+            if data_split.indices is None:
+                return super().split_data()
+            split_indices.append(np.asarray(data_split.indices, dtype=np.int64))
+
+        taken = self.data.take(np.concatenate(split_indices))
+
+        data_holder: Dict[str, Data] = {}
+        offset = 0
+        for data_split, indices in zip(data_splits, split_indices):
+            data_holder[data_split.label] = Data(X=taken.slice(offset, len(indices)))
+            offset += len(indices)
+
+        return data_holder
 
     def load_data(self, path: Path) -> None:
         """Load parquet dataset to pandas dataframe"""
 
         load_path = path.with_suffix(self.data_suffix)
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path).read()
+        pa_table: pa.Table = pq.read_table(load_path)
 
         self.data = pa_table
 
@@ -18,6 +18,18 @@ try:
 except ModuleNotFoundError:
     ProfileReport = Any
 
+# Parquet options shared by the tabular interfaces. Row groups are smaller than pyarrow's
+# 1Mi-row default and carry min/max statistics so readers can skip groups; zstd and
+# dictionary encoding shrink repeated values.
+PARQUET_WRITE_OPTIONS: Dict[str, Any] = {
+    "row_group_size": 262144,
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+
 
 class DataInterface(BaseModel):
     """Base data interface for all data types
@@ -236,9 +248,10 @@ class DataInterface(BaseModel):
         if self.data is None:
             raise ValueError("Data must not be None. Either supply data or load data")
 
-        if len(self.data_splits) > 0:
+        data_splits = self.data_splits
+        if data_splits:
             data_holder: Dict[str, Data] = {}
-            for data_split in self.data_splits:
+            for data_split in data_splits:
                 label, data = DataSplitter.split(
                     split=data_split,
                     dependent_vars=self.dependent_vars,
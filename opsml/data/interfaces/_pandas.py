@@ -1,14 +1,19 @@
 from pathlib import Path
-from typing import Optional, cast
+from typing import Dict, Optional, cast
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from opsml.data.formatter import check_data_schema
-from opsml.data.interfaces._base import DataInterface
+from opsml.data.interfaces._base import PARQUET_WRITE_OPTIONS, DataInterface
+from opsml.data.splitter import Data
 from opsml.types import AllowedDataType, Feature, Suffix
 
+# below this many splits, one boolean mask per split is cheaper than factorizing and sorting
+_MIN_GROUPED_SPLITS = 4
+
 
 class PandasData(DataInterface):
     """Pandas interface
@@ -36,7 +41,8 @@ class PandasData(DataInterface):
         """Saves pandas dataframe to parquet"""
 
         assert self.data is not None, "No data detected in interface"
-        arrow_table = pa.Table.from_pandas(self.data, preserve_index=False)
+        # convert columns in parallel; pyarrow only threads long, narrow frames by default
+        arrow_table = pa.Table.from_pandas(self.data, preserve_index=False, nthreads=pa.cpu_count())
         self.feature_map = {
             key: Feature(
                 feature_type=str(value),
@@ -44,12 +50,67 @@ class PandasData(DataInterface):
             )
             for key, value in self.data.dtypes.to_dict().items()
         }
-        pq.write_table(arrow_table, path)
+        pq.write_table(arrow_table, path, **PARQUET_WRITE_OPTIONS)
+
+    def split_data(self) -> Dict[str, Data]:
+        """Splits data interface according to data split logic. When there are several
+        equality splits on the same column, the column is factorized once and rows are
+        grouped by code, so each split gathers its rows without re-scanning the column.
+
+        Returns
+            Class containing data splits
+        """
+        data_splits = self.data_splits
+        if self.data is None or len(data_splits) < _MIN_GROUPED_SPLITS:
+            return super().split_data()
+
+        # index and row splits take precedence in DataSplitter, so only pure equality splits qualify
+        column_name = data_splits[0].column_name
+        if column_name is None or any(
+            data_split.column_name != column_name
+            or data_split.inequality is not None
+            or data_split.column_value is None
+            or data_split.indices is not None
+            or data_split.start is not None
+            for data_split in data_splits
+        ):
+            return super().split_data()
+
+        # missing values get code -1 and never match, as with ==
+        codes, uniques = pd.factorize(self.data[column_name], sort=False)
+        if len(uniques) < np.iinfo(np.int16).max:
+            # numpy uses a radix sort for stable sorts of 16-bit integers
+            codes = codes.astype(np.int16)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        dependent_mask = self.data.columns.isin(self.dependent_vars)
+
+        data_holder: Dict[str, Data] = {}
+        for data_split in data_splits:
+            # compare against the uniques so pandas' coercion applies (e.g. str values on datetime columns)
+            matches = np.flatnonzero(np.asarray(uniques == data_split.column_value))
+            # rows within a code are already in frame order; only a multi-code match needs re-sorting
+            segments = [order[bounds[code] : bounds[code + 1]] for code in matches]
+            if len(segments) == 1:
+                rows = segments[0]
+            else:
+                rows = np.sort(np.concatenate(segments)) if segments else np.empty(0, dtype=np.intp)
+            data = self.data.iloc[rows]
+
+            if bool(self.dependent_vars):
+                data_holder[data_split.label] = Data(
+                    X=data[data.columns[~dependent_mask]],
+                    y=data[data.columns[dependent_mask]],
+                )
+            else:
+                data_holder[data_split.label] = Data(X=data)
+
+        return data_holder
 
     def load_data(self, path: Path) -> None:
         """Load parquet dataset to pandas dataframe"""
 
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=path).read()
+        pa_table: pa.Table = pq.read_table(path)
 
         data = check_data_schema(
             pa_table.to_pandas(),
@@ -6,7 +6,7 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 from opsml.data.formatter import check_data_schema
-from opsml.data.interfaces._base import DataInterface
+from opsml.data.interfaces._base import PARQUET_WRITE_OPTIONS, DataInterface
 from opsml.types import AllowedDataType, Feature, Suffix
 
 
@@ -44,15 +44,18 @@ class PolarsData(DataInterface):
             for key, value in self.data.schema.items()
         }
 
-        pq.write_table(self.data.to_arrow(), path)
+        pa_table: pa.Table = self.data.to_arrow()
+
+        pq.write_table(pa_table, path, **PARQUET_WRITE_OPTIONS)
 
     def load_data(self, path: Path) -> None:
-        """Load parquet dataset to pandas dataframe"""
+        """Load parquet dataset to polars dataframe"""
 
         load_path = path.with_suffix(self.data_suffix)
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path).read()
+
+        # read directly into polars (no intermediate arrow table)
         data = check_data_schema(
-            pl.from_arrow(data=pa_table),
+            pl.scan_parquet(load_path).collect(streaming=True),
             self.feature_map,
             self.data_type,
         )
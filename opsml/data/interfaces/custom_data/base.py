@@ -2,18 +2,21 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import json
-from functools import cached_property
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pyarrow as pa
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 
 from opsml.helpers.logging import ArtifactLogger
 from opsml.types import CommonKwargs, Description, Suffix
 
 logger = ArtifactLogger.get_logger()
 
+# number of metadata records encoded per write call
+WRITE_CHUNK_SIZE = 10_000
+
 
 def check_for_dirs(data_dir: Path) -> List[str]:
     """Checks if data_dir contains subdirectories and returns a list of subdirectories
@@ -25,7 +28,9 @@ def check_for_dirs(data_dir: Path) -> List[str]:
     Returns:
         List of subdirectories
     """
-    dirs = [x.stem for x in data_dir.iterdir() if x.is_dir()]
+    # DirEntry.is_dir uses the cached directory entry type (no extra stat on most filesystems)
+    with os.scandir(data_dir) as entries:
+        dirs = [os.path.splitext(entry.name)[0] for entry in entries if entry.is_dir()]
     return dirs
 
 
@@ -47,7 +52,12 @@ def get_metadata_filepath(data_dir: Path, split: Optional[str] = None) -> List[P
     else:
         search_path = data_dir
 
-    paths = [p for p in search_path.rglob("*.jsonl") if p.name == "metadata.jsonl"]
+    # metadata is written either directly to the search path or to split subdirectories
+    direct_path = search_path / "metadata.jsonl"
+    if direct_path.is_file():
+        return [direct_path]
+
+    paths = list(search_path.rglob("metadata.jsonl"))
 
     if paths:
         return paths
@@ -78,15 +88,17 @@ class FileRecord(BaseModel):
         if isinstance(filepath, str):
             filepath = Path(filepath)
 
-        # if reloading record
-        if all([filepath, size]):
+        # if reloading record (size may legitimately be 0, so check for None)
+        if filepath is not None and size is not None:
             return data_args
 
         # Check image exists
         assert filepath, "Filepath is required"
 
-        assert filepath.exists(), f"File {filepath} does not exist"
-        data_args["size"] = filepath.stat().st_size
+        try:
+            data_args["size"] = os.stat(filepath).st_size
+        except FileNotFoundError as error:
+            raise ValueError(f"File {filepath} does not exist") from error
 
         return data_args
 
@@ -114,6 +126,9 @@ class Metadata(BaseModel):
 
     records: List[FileRecord]
 
+    # (records list, record count, total size) the cached size was computed from
+    _size_cache: Optional[Tuple[List[FileRecord], int, int]] = PrivateAttr(default=None)
+
     def write_to_file(self, filepath: Path) -> None:
         """Write image metadata to jsonl file
 
@@ -126,11 +141,14 @@ class Metadata(BaseModel):
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with filepath.open("w", encoding="utf-8") as file_:
-            for record in self.records:
-                dumped_record = record.model_dump()
-                dumped_record["filepath"] = dumped_record["filepath"].as_posix()
-                json.dump(dumped_record, file_)
-                file_.write("\n")
+            # encode records in chunks and write each chunk with a single call
+            for chunk in yield_chunks(self.records, WRITE_CHUNK_SIZE):
+                lines = []
+                for record in chunk:
+                    dumped_record = record.model_dump()
+                    dumped_record["filepath"] = record.filepath.as_posix()
+                    lines.append(json.dumps(dumped_record))
+                file_.write("\n".join(lines) + "\n")
 
     @classmethod
     def load_from_file(cls, filepath: Path) -> Any:
@@ -143,10 +161,20 @@ class Metadata(BaseModel):
         """
         raise NotImplementedError
 
-    @cached_property
+    @property
     def size(self) -> int:
-        """Total size of all images in metadata"""
-        return sum(record.size for record in self.records)
+        """Total size of all images in metadata.
+
+        The total is cached and recomputed when `records` is reassigned or records are
+        added or removed. Replacing a record in place at the same length is not tracked.
+        """
+        cache = self._size_cache
+        if cache is not None and cache[0] is self.records and cache[1] == len(self.records):
+            return cache[2]
+
+        total = sum(record.size for record in self.records)
+        self._size_cache = (self.records, len(self.records), total)
+        return total
 
 
 class Dataset(BaseModel):
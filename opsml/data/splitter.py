@@ -3,8 +3,9 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 from dataclasses import dataclass
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union, cast
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
@@ -33,8 +34,15 @@ class DataSplit(BaseModel):
 
     @field_validator("indices", mode="before")
     @classmethod
-    def convert_to_list(cls, value: Optional[List[int]]) -> Optional[List[int]]:
-        """Pre to convert indices to list if not None"""
+    def convert_to_list(cls, value: Optional[Any]) -> Optional[List[int]]:
+        """Pre to convert indices to list if not None. Numpy arrays are converted with
+        a single tolist call rather than iterating numpy scalars"""
+
+        if isinstance(value, np.ndarray):
+            # a boolean mask would otherwise be read as 0/1 indices
+            if value.dtype == np.bool_:
+                raise ValueError("Indices must not be a boolean array")
+            return cast(List[int], value.tolist())
 
         if value is not None and not isinstance(value, list):
             value = list(value)
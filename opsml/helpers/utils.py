@@ -10,9 +10,9 @@ import re
 import string
 import tempfile
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, Generator, Hashable, List, Optional, Set, Type, Union, cast
 
 from opsml.helpers import exceptions
 from opsml.helpers.logging import ArtifactLogger
@@ -293,7 +293,11 @@ def get_class_name(object_: object) -> str:
     Returns:
         fully qualified class name
     """
-    klass = object_.__class__
+    return _get_qualified_name(cast(Hashable, object_.__class__))
+
+
+@lru_cache(maxsize=256)
+def _get_qualified_name(klass: Type[Any]) -> str:
     module = klass.__module__
     if module == "builtins":
         return klass.__qualname__  # avoid outputs like 'builtins.str'
@@ -1,6 +1,7 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, cast
 
 from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
@@ -107,6 +108,7 @@ class ModelChallenger:
         self._challenger = challenger
         self._challenger_metric: Optional[Metric] = None
         self._registries = CardRegistries()
+        self._runcards: Dict[str, RunCard] = {}
 
     @property
     def challenger_metric(self) -> Metric:
@@ -140,6 +142,14 @@ class ModelChallenger:
 
         return champion_record
 
+    def _load_runcard(self, runcard_uid: str) -> RunCard:
+        """Loads a RunCard from uid, reusing previously loaded cards"""
+        runcard = self._runcards.get(runcard_uid)
+        if runcard is None:
+            runcard = cast(RunCard, self._registries.run.load_card(uid=runcard_uid))
+            self._runcards[runcard_uid] = runcard
+        return runcard
+
     def _get_runcard_metric(self, runcard_uid: str, metric_name: str) -> Metric:
         """
         Loads a RunCard from uid
@@ -151,8 +161,7 @@ class ModelChallenger:
                 Name of metric
 
         """
-        runcard = cast(RunCard, self._registries.run.load_card(uid=runcard_uid))
-        metric = runcard.get_metric(name=metric_name)
+        metric = self._load_runcard(runcard_uid=runcard_uid).get_metric(name=metric_name)
 
         if isinstance(metric, list):
             metric = metric[0]
@@ -216,38 +225,54 @@ class ModelChallenger:
             lower_is_better=lower_is_better,
         )
 
+    def _get_champion_record(self, champion: CardInfo) -> Dict[str, Any]:
+        """Fetches the registry record and RunCard for a champion"""
+        records = self._registries.model.list_cards(
+            info=champion,
+        )
+
+        if not bool(records):
+            raise ValueError(f"Champion model does not exist. {champion}")
+
+        champion_card = records[0]
+        runcard_uid = champion_card.get("runcard_uid")
+        if runcard_uid is None:
+            raise ValueError(f"No RunCard associated with champion: {champion}")
+
+        # update name, repository and version in case of None
+        champion.name = champion.name or champion_card.get("name")
+        champion.repository = champion.repository or champion_card.get("repository")
+        champion.version = champion.version or champion_card.get("version")
+
+        self._load_runcard(runcard_uid=runcard_uid)
+
+        return champion_card
+
+    def _get_champion_records(self, champions: List[CardInfo]) -> List[Dict[str, Any]]:
+        """Fetches champion records concurrently so that records can be
+        reused across all metrics being challenged"""
+        if not champions:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(champions))) as executor:
+            return list(executor.map(self._get_champion_record, champions))
+
     def _battle_champions(
         self,
         champions: List[CardInfo],
+        champion_records: List[Dict[str, Any]],
         metric_name: str,
         lower_is_better: bool,
     ) -> List[BattleReport]:
         """Loops through and creates a `BattleReport` for each champion"""
         battle_reports = []
 
-        for champion in champions:
-            champion_record = self._registries.model.list_cards(
-                info=champion,
-            )
-
-            if not bool(champion_record):
-                raise ValueError(f"Champion model does not exist. {champion}")
-
-            champion_card = champion_record[0]
-            runcard_uid = champion_card.get("runcard_uid")
-            if runcard_uid is None:
-                raise ValueError(f"No RunCard associated with champion: {champion}")
-
+        for champion, champion_card in zip(champions, champion_records):
             champion_metric = self._get_runcard_metric(
-                runcard_uid=runcard_uid,
+                runcard_uid=champion_card["runcard_uid"],
                 metric_name=metric_name,
             )
 
-            # update name, repository and version in case of None
-            champion.name = champion.name or champion_card.get("name")
-            champion.repository = champion.repository or champion_card.get("repository")
-            champion.version = champion.version or champion_card.get("version")
-
             battle_reports.append(
                 self._battle(
                     champion=champion,
@@ -290,6 +315,7 @@ class ModelChallenger:
         )
 
         report_dict = {}
+        champion_records = self._get_champion_records(champions) if champions is not None else []
 
         for name, value, _lower_is_better in zip(
             inputs.metric_names,
@@ -318,6 +344,7 @@ class ModelChallenger:
             else:
                 report_dict[name] = self._battle_champions(
                     champions=champions,
+                    champion_records=champion_records,
                     metric_name=name,
                     lower_is_better=_lower_is_better,
                 )
@@ -283,7 +283,30 @@ try:
             save_path = path / SaveName.QUANTIZED_MODEL.value
             quantizer = ORTQuantizer.from_pretrained(onnx_model)
 
-            quantizer.quantize(save_dir=save_path, quantization_config=self.onnx_args.config)
+            if not getattr(self.onnx_args.config, "is_static", False):
+                quantizer.quantize(save_dir=save_path, quantization_config=self.onnx_args.config)
+                return None
+
+            # static quantization requires activation ranges computed from calibration data
+            assert (
+                self.onnx_args.calibration_dataset is not None
+            ), "A calibration dataset is required for static quantization"
+
+            from optimum.onnxruntime.configuration import AutoCalibrationConfig
+
+            calibration_config = AutoCalibrationConfig.minmax(self.onnx_args.calibration_dataset)
+            ranges = quantizer.fit(
+                dataset=self.onnx_args.calibration_dataset,
+                calibration_config=calibration_config,
+                operators_to_quantize=self.onnx_args.config.operators_to_quantize,
+            )
+
+            quantizer.quantize(
+                save_dir=save_path,
+                quantization_config=self.onnx_args.config,
+                calibration_tensors_range=ranges,
+            )
+            return None
 
         def _convert_to_onnx_inplace(self) -> None:
             """Converts model to onnx in place"""
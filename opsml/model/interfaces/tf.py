@@ -1,3 +1,4 @@
+from functools import singledispatch
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -19,6 +20,34 @@ try:
 
     ArrayType = Union[NDArray[Any], tf.Tensor]
 
+    # resolved once at import rather than on every validation/load
+    _KERAS_MODEL = tf.keras.Model
+    _LOAD_KERAS_MODEL = tf.keras.models.load_model
+
+    # first record of each sample
+    _HEAD = slice(0, 1)
+
+    @singledispatch
+    def _slice_sample(sample_data: Any) -> Any:
+        raise ValueError("Provided sample data is not a valid type")
+
+    @_slice_sample.register(np.ndarray)
+    @_slice_sample.register(tf.Tensor)
+    def _(sample_data: ArrayType) -> ArrayType:
+        return sample_data[_HEAD]
+
+    @_slice_sample.register(list)
+    def _(sample_data: List[ArrayType]) -> List[ArrayType]:
+        return [data[_HEAD] for data in sample_data]
+
+    @_slice_sample.register(tuple)
+    def _(sample_data: Tuple[ArrayType, ...]) -> Tuple[ArrayType, ...]:
+        return tuple(data[_HEAD] for data in sample_data)
+
+    @_slice_sample.register(dict)
+    def _(sample_data: Dict[str, ArrayType]) -> Dict[str, ArrayType]:
+        return {key: value[_HEAD] for key, value in sample_data.items()}
+
     class TensorFlowModel(ModelInterface):
         """Model interface for Tensorflow models.
 
@@ -60,22 +89,7 @@ try:
                 Sample data with only one record
             """
 
-            if isinstance(sample_data, (np.ndarray, tf.Tensor)):
-                return sample_data[0:1]
-
-            if isinstance(sample_data, list):
-                return [data[0:1] for data in sample_data]
-
-            if isinstance(sample_data, tuple):
-                return (data[0:1] for data in sample_data)
-
-            if isinstance(sample_data, dict):
-                sample_dict = {}
-                for key, value in sample_data.items():
-                    sample_dict[key] = value[0:1]
-                return sample_dict
-
-            raise ValueError("Provided sample data is not a valid type")
+            return _slice_sample(sample_data)
 
         @model_validator(mode="before")
         @classmethod
@@ -87,7 +101,7 @@ try:
 
             model, module, bases = get_model_args(model)
 
-            assert isinstance(model, tf.keras.Model), "Model must be a tensorflow keras model"
+            assert isinstance(model, _KERAS_MODEL), "Model must be a tensorflow keras model"
 
             if "keras" in module:
                 model_args[CommonKwargs.MODEL_TYPE.value] = model.__class__.__name__
@@ -125,7 +139,7 @@ try:
                 kwargs:
                     Additional arguments to be passed to load_model
             """
-            self.model = tf.keras.models.load_model(path, **kwargs)
+            self.model = _LOAD_KERAS_MODEL(path, **kwargs)
 
         def save_preprocessor(self, path: Path) -> None:
             """Saves preprocessor to path if present. Base implementation use Joblib
@@ -3,7 +3,7 @@
 # LICENSE file in the root directory of this source tree.
 
 from functools import cached_property
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -22,11 +22,18 @@ from opsml.types import (
 logger = ArtifactLogger.get_logger()
 
 
-ARRAY_TYPES = [
-    AllowedDataType.NUMPY,
-    AllowedDataType.TENSORFLOW_TENSOR,
-    AllowedDataType.TORCH_TENSOR,
-]
+ARRAY_TYPES = frozenset(
+    {
+        AllowedDataType.NUMPY.value,
+        AllowedDataType.TENSORFLOW_TENSOR.value,
+        AllowedDataType.TORCH_TENSOR.value,
+    }
+)
+
+
+def _is_array(data: Any) -> bool:
+    # numpy arrays are the common case and can be matched on type without building a class name
+    return type(data) is np.ndarray or get_class_name(data) in ARRAY_TYPES  # pylint: disable=unidiomatic-typecheck
 
 
 class ArrayHelper:
@@ -45,9 +52,7 @@ class ArrayHelper:
 
     @classmethod
     def get_array_stats(cls, data: Any) -> Tuple[str, Tuple[int, ...]]:
-        data_type = get_class_name(data)
-
-        if data_type == AllowedDataType.NUMPY:
+        if type(data) is np.ndarray:  # pylint: disable=unidiomatic-typecheck
             return cls.get_numpy_stats(data)
         return cls.get_tensor_stats(data)
 
@@ -246,9 +251,7 @@ class DataDictionary(ModelDataHelper):
         types: List[str] = []
         shapes: List[Tuple[int, ...]] = []
         for _, value in self.data.items():
-            data_name = get_class_name(value)
-
-            if data_name in ARRAY_TYPES:
+            if _is_array(value):
                 dtype, shape = ArrayHelper.get_array_stats(value)
 
             else:
@@ -295,9 +298,7 @@ class IterData(ModelDataHelper):
         shapes: List[Tuple[int, ...]] = []
 
         for value in self.data:
-            data_name = get_class_name(value)
-
-            if data_name in ARRAY_TYPES:
+            if _is_array(value):
                 dtype, shape = ArrayHelper.get_array_stats(value)
 
             else:
@@ -471,6 +472,20 @@ class NumericData(ModelDataHelper):
         return ("int" in data_type) or ("float" in data_type)
 
 
+# exact data_type -> helper lookup; substring matches (numeric, ImageFile, DMatrix) fall back to validate
+_MODEL_DATA_BY_TYPE: Dict[str, Type[ModelDataHelper]] = {
+    AllowedDataType.NUMPY.value: ArrayData,
+    AllowedDataType.TENSORFLOW_TENSOR.value: ArrayData,
+    AllowedDataType.TORCH_TENSOR.value: ArrayData,
+    AllowedDataType.PANDAS.value: PandasDataFrameData,
+    AllowedDataType.DICT.value: DataDictionary,
+    AllowedDataType.ORDERED_DICT.value: DataDictionary,
+    AllowedDataType.TUPLE.value: IterData,
+    AllowedDataType.LIST.value: IterData,
+    AllowedDataType.STR.value: StrData,
+}
+
+
 def get_model_data(data_type: str, input_data: Any) -> ModelDataHelper:
     """Sets the appropriate ModelData subclass depending
     on data_type passed
@@ -480,6 +495,10 @@ def get_model_data(data_type: str, input_data: Any) -> ModelDataHelper:
         input_data (Any): Input data for model
     """
 
+    model_data = _MODEL_DATA_BY_TYPE.get(data_type)
+    if model_data is not None:
+        return model_data(input_data=input_data, data_type=data_type)
+
     model_data = next(
         data_class
         for data_class in ModelDataHelper.__subclasses__()
@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field, field_validator
 from opsml.settings.config import config
 from opsml.types.extra import CommonKwargs
 
+# maps "_" -> "-" when normalizing identifiers
+_IDENTIFIER_TABLE = str.maketrans({"_": "-"})
+
 
 class Tags(str, Enum):
     NAME = "name"
@@ -41,7 +44,7 @@ class ProjectInfo(BaseModel):
     )
 
     run_id: Optional[str] = Field(
-        default=config.opsml_run_id,
+        default_factory=lambda: config.opsml_run_id,
         description="An existing run_id to use. If None, a new run is created when the project is activated",
     )
 
@@ -57,6 +60,7 @@ class ProjectInfo(BaseModel):
     )
 
     @field_validator("name", mode="before")
+    @classmethod
     def identifier_validator(cls, value: Optional[str]) -> Optional[str]:
         """Lowers and strips an identifier.
 
@@ -64,4 +68,4 @@ class ProjectInfo(BaseModel):
         project identifiers."""
         if value is None:
             return None
-        return value.strip().lower().replace("_", "-")
+        return value.strip().lower().translate(_IDENTIFIER_TABLE)
@@ -259,7 +259,8 @@ class SQLRegistryBase:
         assert bool(record), "Card does not exist in registry. Please use register card first"
         logger.info("Updating card {}/{} with version {}", card.repository, card.name, card.version)
         save_card_artifacts(card=card)
-        save_record: SaveRecord = registry_name_record_map[card.card_type](**card.create_registry_record())
+        registry_record: SaveRecord = registry_name_record_map[card.card_type]
+        save_record = registry_record.model_validate(card.create_registry_record())
 
         self.update_card_record(card=save_record.model_dump())
 
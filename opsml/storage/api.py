@@ -5,7 +5,7 @@ import json as py_json
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 import httpx
 from tenacity import retry, stop_after_attempt
@@ -124,13 +124,14 @@ class ApiClient:
         headers: Optional[Dict[str, Any]] = None,
         chunk_size: Optional[int] = None,
     ) -> Dict[str, Any]:
-        result = ""
+        chunks: List[bytes] = []
         url = f"{self._base_url}/{route}"
         with self.client.stream(method="POST", url=url, files=files, headers=headers) as response:
             for data in response.iter_bytes(chunk_size=chunk_size):
-                result += data.decode("utf-8")
+                chunks.append(data)
 
-        response_result = cast(Dict[str, Any], py_json.loads(result))
+        # join once and let json decode the raw bytes instead of decoding and concatenating per chunk
+        response_result = cast(Dict[str, Any], py_json.loads(b"".join(chunks)))
 
         if response.status_code == 200:
             return response_result
@@ -2,12 +2,13 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
 from typing import Optional, cast
 
 import joblib
-from pydantic import BaseModel
 
 from opsml.cards.audit import AuditCard
 from opsml.cards.base import ArtifactCard
@@ -27,7 +28,8 @@ from opsml.types.extra import Suffix
 logger = ArtifactLogger.get_logger()
 
 
-class CardUris(BaseModel):
+@dataclass
+class CardUris:
     data_uri: Optional[Path] = None
     trained_model_uri: Optional[Path] = None
     preprocessor_uri: Optional[Path] = None
@@ -178,8 +180,14 @@ class DataCardSaver(CardSaver):
         with tempfile.TemporaryDirectory() as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
-            self._save_data()
-            self._save_data_profile()
+
+            # write data in the background while the profile renders on this thread
+            # (profile rendering uses matplotlib, which is not thread-safe)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                data_future = executor.submit(self._save_data)
+                self._save_data_profile()
+                data_future.result()
+
             self._save_datacard()
             client.storage_client.put(self.lpath, self.rpath)
 
@@ -324,6 +332,7 @@ class ModelCardSaver(CardSaver):
         if dumped_model["interface"].get("onnx_args") is not None:
             if dumped_model["interface"]["onnx_args"].get("config") is not None:
                 dumped_model["interface"]["onnx_args"].pop("config")
+            dumped_model["interface"]["onnx_args"].pop("calibration_dataset", None)
 
         save_path = Path(self.lpath / SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
         joblib.dump(dumped_model, save_path)
@@ -7,6 +7,7 @@
 import datetime
 import io
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import cached_property
 from pathlib import Path
 from typing import Any, BinaryIO, Iterator, List, Optional, Protocol, cast
@@ -33,6 +34,8 @@ warnings.filterwarnings("ignore", message="Hint: Inferred schema contains intege
 
 logger = ArtifactLogger.get_logger()
 
+_MAX_UPLOAD_WORKERS = 8
+
 
 class _FileSystemProtocol(Protocol):
     """
@@ -321,18 +324,28 @@ class ApiStorageClient(StorageClientBase):
 
     def put(self, lpath: Path, rpath: Path) -> None:
         if not lpath.is_file():
-            for curr_lpath in lpath.rglob("*"):
-                if curr_lpath.is_file():
-                    curr_rpath = rpath / curr_lpath.relative_to(lpath)
-                    self.put(curr_lpath, curr_rpath)
+            lpaths = [curr_lpath for curr_lpath in lpath.rglob("*") if curr_lpath.is_file()]
+            if not lpaths:
+                return None
+
+            # uploads are independent, so overlap them over the api client's pooled connections
+            with ThreadPoolExecutor(max_workers=min(_MAX_UPLOAD_WORKERS, len(lpaths))) as executor:
+                futures = [
+                    executor.submit(self.put, curr_lpath, rpath / curr_lpath.relative_to(lpath))
+                    for curr_lpath in lpaths
+                ]
+                for future in as_completed(futures):
+                    future.result()
             return None
 
-        response = self.api_client.stream_post_request(
-            route=ApiRoutes.UPLOAD_FILE,
-            files={"file": lpath.open("rb")},
-            headers={"write_path": rpath.as_posix()},
-            chunk_size=config.upload_chunk_size,
-        )
+        # httpx streams the open file handle directly rather than reading it into memory
+        with lpath.open("rb") as file_:
+            response = self.api_client.stream_post_request(
+                route=ApiRoutes.UPLOAD_FILE,
+                files={"file": file_},
+                headers={"write_path": rpath.as_posix()},
+                chunk_size=config.upload_chunk_size,
+            )
         storage_uri: Optional[str] = response.get("storage_uri")
 
         if storage_uri is None:
@@ -7,9 +7,9 @@ import datetime
 import os
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, List, Optional, Union
 
-from pydantic import BaseModel, SerializeAsAny
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny
 
 
 class RegistryType(str, Enum):
@@ -22,20 +22,11 @@ class RegistryType(str, Enum):
 
     @staticmethod
     def from_str(name: str) -> "RegistryType":
-        l_name = name.strip().lower()
-        if l_name == "data":
-            return RegistryType.DATA
-        if l_name == "model":
-            return RegistryType.MODEL
-        if l_name == "run":
-            return RegistryType.RUN
-        if l_name == "pipeline":
-            return RegistryType.PIPELINE
-        if l_name == "project":
-            return RegistryType.PROJECT
-        if l_name == "audit":
-            return RegistryType.AUDIT
-        raise NotImplementedError()
+        # enum values are the lowercase registry names
+        try:
+            return RegistryType(name.strip().lower())
+        except ValueError as error:
+            raise NotImplementedError() from error
 
 
 class Metric(BaseModel):
@@ -44,11 +35,15 @@ class Metric(BaseModel):
     step: Optional[int] = None
     timestamp: Optional[int] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Param(BaseModel):
     name: str
     value: Union[float, int, str]
 
+    model_config = ConfigDict(frozen=True)
+
 
 class RunGraph(BaseModel):
     name: str
@@ -74,12 +69,12 @@ ArtifactUris = Dict[str, Artifact]
 class Comment(BaseModel):
     name: str
     comment: str
-    timestamp: str = str(datetime.datetime.today().strftime("%Y-%m-%d %H:%M"))
+    timestamp: str = Field(default_factory=lambda: datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Comment):
             return False
-        return self.__dict__ == other.__dict__
+        return (self.name, self.comment, self.timestamp) == (other.name, other.comment, other.timestamp)
 
 
 @dataclass
@@ -147,6 +142,8 @@ class CardVersion(BaseModel):
     version: str
     card_type: CardType
 
+    model_config = ConfigDict(frozen=True)
+
 
 class AuditCardMetadata(BaseModel):
     datacards: List[SerializeAsAny[CardVersion]] = []
@@ -154,6 +151,8 @@ class AuditCardMetadata(BaseModel):
     runcards: List[SerializeAsAny[CardVersion]] = []
 
 
-NON_PIPELINE_CARDS = [card.value for card in CardType if card.value not in ["pipeline", "project", "audit"]]
+NON_PIPELINE_CARDS: FrozenSet[str] = frozenset(
+    card.value for card in CardType if card.value not in {"pipeline", "project", "audit"}
+)
 
 AuditSectionType = Dict[str, Dict[int, Dict[str, str]]]
@@ -1,7 +1,10 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
+import os
 from enum import Enum, unique
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel, field_validator
@@ -104,6 +107,26 @@ class ArtifactClass(str, Enum):
     OTHER = "other"
 
 
+@lru_cache(maxsize=128)
+def _find_markdown(name: str, path: str) -> Path:
+    """Finds a markdown file. Cached so cards sharing a summary file only search
+    the directory tree once"""
+    return FileUtils.find_filepath(name=name, path=path)
+
+
+def _load_markdown(name: str, path: str) -> str:
+    """Reads a markdown file. The file is read on every call so edits are picked up"""
+    mkdwn_path = _find_markdown(name=name, path=path)
+
+    # file was moved or deleted since it was found
+    if not mkdwn_path.is_file():
+        _find_markdown.cache_clear()
+        mkdwn_path = _find_markdown(name=name, path=path)
+
+    with open(mkdwn_path, "r", encoding="utf-8") as file_:
+        return file_.read()
+
+
 class Description(BaseModel):
     summary: Optional[str] = None
     sample_code: Optional[str] = None
@@ -115,11 +138,9 @@ class Description(BaseModel):
         if summary is None:
             return summary
 
-        if ".md" in summary.lower():
+        if summary[-3:].lower() == ".md":
             try:
-                mkdwn_path = FileUtils.find_filepath(name=summary)
-                with open(mkdwn_path, "r", encoding="utf-8") as file_:
-                    summary = file_.read()
+                summary = _load_markdown(name=summary, path=os.getcwd())
 
             except IndexError as idx_error:
                 logger.info(f"Could not load markdown file {idx_error}")
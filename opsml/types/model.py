@@ -16,7 +16,7 @@ import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from opsml.helpers.logging import ArtifactLogger
 from opsml.types.extra import Description
@@ -208,12 +208,16 @@ class HuggingFaceOnnxArgs(BaseModel):
             Onnx runtime provider to use
         config:
             Optional optimum config to use
+        calibration_dataset:
+            Optional calibration dataset (`datasets.Dataset`) of model inputs. Required when
+            `config` is a static quantization config
     """
 
     ort_type: str
     provider: str = "CPUExecutionProvider"
     quantize: bool = False
     config: Optional[Any] = None
+    calibration_dataset: Optional[Any] = None
 
     @field_validator("ort_type", mode="before")
     @classmethod
@@ -248,6 +252,13 @@ class HuggingFaceOnnxArgs(BaseModel):
 
         return config
 
+    @model_validator(mode="after")
+    def check_calibration_dataset(self) -> "HuggingFaceOnnxArgs":
+        """Static quantization computes activation ranges from calibration data"""
+        if self.quantize and getattr(self.config, "is_static", False) and self.calibration_dataset is None:
+            raise ValueError("A calibration_dataset is required when using a static quantization config")
+        return self
+
 
 class ModelCardMetadata(BaseModel):
     """Create modelcard metadata
@@ -9,7 +9,7 @@ from enum import Enum, unique
 from pathlib import Path
 from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Protocol, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 FilePath = Union[List[str], str]
 
@@ -24,7 +24,7 @@ class StorageSystem(Enum):
 
 class StorageClientSettings(BaseModel):
     storage_system: StorageSystem = StorageSystem.LOCAL
-    storage_uri: str = os.getcwd()
+    storage_uri: str = Field(default_factory=os.getcwd)
 
 
 class GcsStorageClientSettings(StorageClientSettings):
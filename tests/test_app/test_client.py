@@ -560,6 +560,29 @@ def test_card_update_fail(test_app: TestClient) -> None:
     assert response.status_code == 500
 
 
+@pytest.mark.parametrize("route", ["/opsml/cards/create", "/opsml/cards/update"])
+def test_card_write_malformed_body(test_app: TestClient, route: str) -> None:
+    """Malformed bodies are rejected with FastAPI-style 422 errors"""
+
+    response = test_app.post(
+        route,
+        json={"registry_type": "data"},
+        headers={"X-Prod-Token": "test-token"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "card"]
+
+    response = test_app.post(
+        route,
+        content=b"not json",
+        headers={"X-Prod-Token": "test-token", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+
+    request_body = test_app.app.openapi()["paths"][route]["post"]["requestBody"]
+    assert request_body["content"]["application/json"]["schema"]["required"] == ["card"]
+
+
 def test_card_list_fail(test_app: TestClient) -> None:
     """Test error path"""
 
@@ -1,5 +1,12 @@
-from opsml.app.routes.utils import get_registry_type_from_table
-from opsml.types import RegistryType
+from types import SimpleNamespace
+
+import pytest
+
+from opsml.app.routes.utils import (
+    get_registry_from_table,
+    get_registry_type_from_table,
+)
+from opsml.types import RegistryTableNames, RegistryType
 
 
 def test_get_registry_type_from_table():
@@ -8,3 +15,33 @@ def test_get_registry_type_from_table():
 
     registry_type = get_registry_type_from_table(table_name="OPSML_MODEL_REGISTRY")
     assert registry_type == RegistryType.MODEL.value
+
+
+def test_get_registry_from_table():
+    registries = SimpleNamespace(**{registry_type.value: object() for registry_type in RegistryType})
+    request = SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                registries=registries,
+                registry_by_table={
+                    RegistryTableNames[registry_type.name].value: getattr(registries, registry_type.value)
+                    for registry_type in RegistryType
+                },
+            )
+        )
+    )
+
+    # exact table name
+    registry = get_registry_from_table(request=request, table_name=RegistryTableNames.DATA.value)
+    assert registry is registries.data
+
+    # unknown table name falls back to substring matching
+    registry = get_registry_from_table(request=request, table_name="OPSML_RUN_METRICS")
+    assert registry is registries.run
+
+    # registry type only
+    registry = get_registry_from_table(request=request, registry_type=RegistryType.MODEL.value)
+    assert registry is registries.model
+
+    with pytest.raises(ValueError):
+        get_registry_from_table(request=request)
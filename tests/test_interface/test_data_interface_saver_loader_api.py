@@ -1,7 +1,11 @@
 import shutil
+import threading
 import uuid
 from pathlib import Path
 from typing import cast
+from unittest.mock import patch
+
+import pytest
 
 from opsml.cards import DataCard
 from opsml.data import (
@@ -14,7 +18,7 @@ from opsml.data import (
 )
 from opsml.storage import client
 from opsml.storage.card_loader import CardLoader
-from opsml.storage.card_saver import save_card_artifacts
+from opsml.storage.card_saver import DataCardSaver, save_card_artifacts
 from opsml.types import RegistryType, SaveName
 from opsml.types.extra import Suffix
 
@@ -101,6 +105,47 @@ def test_pandas_api_client(
     assert loaded_card.interface.data_profile is not None
 
 
+
+def test_datacard_saver_profiles_on_calling_thread(pandas_data: PandasData):
+    datacard = DataCard(
+        interface=pandas_data,
+        name="test_data",
+        repository="mlops",
+        contact="test_email",
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    profile_threads = []
+    with patch.object(DataCardSaver, "_save_data"), patch.object(
+        DataCardSaver,
+        "_save_data_profile",
+        side_effect=lambda: profile_threads.append(threading.current_thread()),
+    ), patch.object(DataCardSaver, "_save_datacard"), patch.object(client.storage_client, "put"):
+        save_card_artifacts(datacard)
+
+    assert profile_threads == [threading.current_thread()]
+
+
+def test_datacard_saver_propagates_data_error(pandas_data: PandasData):
+    datacard = DataCard(
+        interface=pandas_data,
+        name="test_data",
+        repository="mlops",
+        contact="test_email",
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    with patch.object(DataCardSaver, "_save_data", side_effect=OSError("disk full")), patch.object(
+        DataCardSaver, "_save_data_profile"
+    ) as save_profile, patch.object(DataCardSaver, "_save_datacard") as save_card:
+        with pytest.raises(OSError, match="disk full"):
+            save_card_artifacts(datacard)
+
+    save_profile.assert_called_once()
+    save_card.assert_not_called()
+
 def test_polars_api_client(
     polars_data: PolarsData,
     api_storage_client: client.StorageClientBase,
@@ -1,6 +1,9 @@
 import uuid
 from pathlib import Path
 from typing import cast
+from unittest.mock import patch
+
+import pytest
 
 from opsml.cards import DataCard
 from opsml.data import (
@@ -262,3 +265,53 @@ def test_text_split_dataset(create_split_text_dataset: Path):
     # cleanup datacard path
     storage_client.rm(Path(OPSML_STORAGE_URI))
     assert not storage_client.exists(Path(OPSML_STORAGE_URI))
+
+
+def test_metadata_size_tracks_records():
+    record = TextRecord(filepath=Path("tests/assets/text_dataset/text1.txt"))
+    metadata = TextMetadata(records=[record])
+    assert metadata.size == 4
+
+    metadata.records.append(TextRecord(filepath=Path("tests/assets/text_dataset/text2.txt")))
+    assert metadata.size == 8
+
+    metadata.records = [record]
+    assert metadata.size == 4
+
+    metadata.records.pop()
+    assert metadata.size == 0
+
+
+def test_metadata_size_is_cached():
+    metadata = TextMetadata(records=[TextRecord(filepath=Path("tests/assets/text_dataset/text1.txt"))])
+    assert metadata.size == 4
+
+    # unchanged records are not re-summed
+    with patch("opsml.data.interfaces.custom_data.base.sum", create=True) as sum_:
+        assert metadata.size == 4
+        sum_.assert_not_called()
+
+
+def test_metadata_write_includes_appended_records(tmp_path: Path):
+    metadata = TextMetadata(records=[TextRecord(filepath=Path("tests/assets/text_dataset/text1.txt"))])
+    metadata.records.append(TextRecord(filepath=Path("tests/assets/text_dataset/text2.txt")))
+
+    metadata_path = tmp_path / "metadata.jsonl"
+    metadata.write_to_file(metadata_path)
+    assert len(metadata_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    loaded = TextMetadata.load_from_file(metadata_path)
+    assert [record.filepath for record in loaded.records] == [record.filepath for record in metadata.records]
+    assert loaded.size == metadata.size == 8
+
+
+def test_file_record_reload_with_zero_size():
+    # reloaded records keep their stored size without touching the filesystem
+    record = TextRecord(filepath="tests/assets/text_dataset/not_there.txt", size=0)
+    assert record.filepath == Path("tests/assets/text_dataset/not_there.txt")
+    assert record.size == 0
+
+
+def test_file_record_missing_file():
+    with pytest.raises(ValueError, match="does not exist"):
+        TextRecord(filepath=Path("tests/assets/text_dataset/not_there.txt"))
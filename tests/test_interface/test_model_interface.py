@@ -1,11 +1,16 @@
 import sys
+from pathlib import Path
 from typing import Tuple
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from opsml.data import NumpyData
 from opsml.model import (
     HuggingFaceModel,
+    HuggingFaceOnnxArgs,
+    HuggingFaceORTModel,
     LightningModel,
     SklearnModel,
     TensorFlowModel,
@@ -33,6 +38,28 @@ def test_tf_interface(tf_transformer_example: TensorFlowModel):
     assert prediction.prediction_type == "numpy.ndarray"
 
 
+@pytest.mark.skipif(EXCLUDE, reason="skipping")
+def test_tf_sample_data_slicing():
+    array = np.arange(6).reshape(3, 2)
+
+    sliced = TensorFlowModel._get_sample_data(array)
+    assert sliced.shape == (1, 2)
+
+    sliced = TensorFlowModel._get_sample_data([array, array])
+    assert isinstance(sliced, list)
+    assert [data.shape for data in sliced] == [(1, 2), (1, 2)]
+
+    sliced = TensorFlowModel._get_sample_data((array, array))
+    assert isinstance(sliced, tuple)
+    assert [data.shape for data in sliced] == [(1, 2), (1, 2)]
+
+    sliced = TensorFlowModel._get_sample_data({"input_1": array, "input_2": array})
+    assert {key: data.shape for key, data in sliced.items()} == {"input_1": (1, 2), "input_2": (1, 2)}
+
+    with pytest.raises(ValueError):
+        TensorFlowModel._get_sample_data("not valid")
+
+
 @pytest.mark.flaky(reruns=2, reruns_delay=5)
 @pytest.mark.skipif(EXCLUDE, reason="skipping")
 def test_torch_interface(deeplabv3_resnet50: TorchModel):
@@ -74,3 +101,48 @@ def test_hf_pipeline_interface(huggingface_text_classification_pipeline: Hugging
 
     prediction = model.get_sample_prediction()
     assert prediction.prediction_type == "dict"
+
+
+def test_hf_static_quantization_requires_calibration_dataset():
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    with pytest.raises(ValueError, match="calibration_dataset"):
+        HuggingFaceOnnxArgs(
+            ort_type=HuggingFaceORTModel.ORT_SEQUENCE_CLASSIFICATION.value,
+            quantize=True,
+            config=AutoQuantizationConfig.avx2(is_static=True, per_channel=True),
+        )
+
+
+@pytest.mark.skipif(EXCLUDE, reason="skipping")
+def test_hf_static_quantization_calibrates(huggingface_torch_distilbert: HuggingFaceModel, tmp_path: Path):
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    calibration_dataset = MagicMock()
+    config = AutoQuantizationConfig.avx2(is_static=True, per_channel=True)
+    model = huggingface_torch_distilbert.model_copy(
+        update={
+            "onnx_args": HuggingFaceOnnxArgs(
+                ort_type=HuggingFaceORTModel.ORT_SEQUENCE_CLASSIFICATION.value,
+                quantize=True,
+                config=config,
+                calibration_dataset=calibration_dataset,
+            )
+        }
+    )
+
+    with patch("optimum.onnxruntime.ORTQuantizer") as quantizer_cls, patch(
+        "optimum.onnxruntime.configuration.AutoCalibrationConfig.minmax"
+    ) as minmax:
+        quantizer = quantizer_cls.from_pretrained.return_value
+        model._quantize_model(tmp_path, onnx_model=MagicMock())
+
+    minmax.assert_called_once_with(calibration_dataset)
+    quantizer.fit.assert_called_once_with(
+        dataset=calibration_dataset,
+        calibration_config=minmax.return_value,
+        operators_to_quantize=config.operators_to_quantize,
+    )
+    quantizer.quantize.assert_called_once()
+    assert quantizer.quantize.call_args.kwargs["calibration_tensors_range"] is quantizer.fit.return_value
+    assert quantizer.quantize.call_args.kwargs["quantization_config"] is config
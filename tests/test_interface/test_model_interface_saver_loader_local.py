@@ -4,6 +4,7 @@ import uuid
 from pathlib import Path
 from typing import cast
 
+import joblib
 import pytest
 from transformers import Pipeline
 
@@ -11,6 +12,8 @@ from opsml.cards import Description, ModelCard, ModelCardMetadata
 from opsml.model import (
     CatBoostModel,
     HuggingFaceModel,
+    HuggingFaceOnnxArgs,
+    HuggingFaceORTModel,
     LightGBMModel,
     LightningModel,
     ModelLoader,
@@ -21,7 +24,7 @@ from opsml.model import (
     XGBoostModel,
 )
 from opsml.storage.card_loader import CardLoader
-from opsml.storage.card_saver import save_card_artifacts
+from opsml.storage.card_saver import ModelCardSaver, save_card_artifacts
 from opsml.types import CommonKwargs, RegistryType, SaveName, Suffix
 
 DARWIN_EXCLUDE = sys.platform == "darwin" and sys.version_info < (3, 11)
@@ -95,6 +98,43 @@ def test_save_huggingface_modelcard(huggingface_torch_distilbert: HuggingFaceMod
     )
 
 
+@pytest.mark.skipif(EXCLUDE, reason="skipping")
+def test_save_huggingface_modelcard_excludes_calibration_dataset(
+    huggingface_torch_distilbert: HuggingFaceModel,
+    tmp_path: Path,
+):
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    model = huggingface_torch_distilbert.model_copy(
+        update={
+            "onnx_args": HuggingFaceOnnxArgs(
+                ort_type=HuggingFaceORTModel.ORT_SEQUENCE_CLASSIFICATION.value,
+                quantize=True,
+                config=AutoQuantizationConfig.avx2(is_static=True, per_channel=True),
+                calibration_dataset=[{"input_ids": [0]}],
+            )
+        }
+    )
+
+    modelcard = ModelCard(
+        interface=model,
+        name="test_model",
+        repository="mlops",
+        contact="test_email",
+        datacard_uid=uuid.uuid4().hex,
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    saver = ModelCardSaver(modelcard)
+    saver.card_uris.lpath = tmp_path
+    saver._save_modelcard()
+
+    dumped = joblib.load(Path(tmp_path, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert "calibration_dataset" not in dumped["interface"]["onnx_args"]
+    assert "config" not in dumped["interface"]["onnx_args"]
+
+
 @pytest.mark.skipif(EXCLUDE, reason="skipping")
 def test_save_huggingface_pipeline_modelcard(huggingface_text_classification_pipeline: HuggingFaceModel):
     model: HuggingFaceModel = huggingface_text_classification_pipeline
@@ -1,3 +1,6 @@
+import datetime
+from unittest.mock import patch
+
 import pytest
 
 from opsml.cards import ArtifactCard
@@ -69,6 +72,20 @@ def test_comment() -> None:
     assert comment1.__eq__(comment2)
 
 
+def test_comment_timestamp_per_instance() -> None:
+    first = datetime.datetime(2024, 1, 1, 9, 30)
+    second = datetime.datetime(2024, 1, 1, 9, 31)
+
+    with patch("opsml.types.card.datetime") as mock_datetime:
+        mock_datetime.datetime.now.side_effect = [first, second]
+        comment1 = Comment(name="foo", comment="bar")
+        comment2 = Comment(name="foo", comment="bar")
+
+    assert comment1.timestamp == "2024-01-01 09:30"
+    assert comment2.timestamp == "2024-01-01 09:31"
+    assert comment1 != comment2
+
+
 def test_argument_fail() -> None:
     card_info = CardInfo(
         name="name",
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import numpy as np
+import pandas as pd
 import pyarrow as pa
 import pytest
 
-from opsml.data import ArrowData
+from opsml.data import ArrowData, DataInterface, PandasData
 from opsml.data.splitter import DataSplit, DataSplitter, DataSplitterBase
 from opsml.types import AllowedDataType
 
@@ -37,3 +40,96 @@ def test_base_splitter():
     splitter = DataSplitterBase(split=split, dependent_vars=[])
     with pytest.raises(ValueError):
         splitter.indices
+
+
+def test_split_indices_from_numpy():
+    split = DataSplit(label="train", indices=np.array([0, 2]))
+
+    assert split.indices == [0, 2]
+    assert all(type(index) is int for index in split.indices)
+    assert split == DataSplit(label="train", indices=np.array([0, 2]))
+    assert split.model_dump(mode="json")["indices"] == [0, 2]
+
+    split = DataSplit(label="train", indices=range(2))
+    assert split.indices == [0, 1]
+
+    split = DataSplit(label="train", indices=np.array([0.0, 2.0]))
+    assert split.indices == [0, 2]
+
+    for indices in [np.array([0.5, 1.0]), np.array([True, False])]:
+        with pytest.raises(ValueError):
+            DataSplit(label="train", indices=indices)
+
+
+def test_arrow_data_batched_index_splits(arrow_data: ArrowData):
+    arrow_data.data_splits = [
+        DataSplit(label="train", indices=np.array([0, 2])),
+        DataSplit(label="test", indices=[1]),
+    ]
+
+    splits = arrow_data.split_data()
+
+    assert splits["train"].X.equals(arrow_data.data.take([0, 2]))
+    assert splits["test"].X.equals(arrow_data.data.take([1]))
+
+
+@pytest.mark.parametrize(
+    "column, values",
+    [
+        (pd.Series([1, 2, 1, 3, 2, 1, None, 3]), [1, 2, 3, 4]),
+        (pd.Series(["a", "b", "a", "c", "b", "a", None, "c"]), ["a", "b", "c", "d"]),
+        (pd.Series(["a", "b", "a", "c", "b", "a", None, "c"], dtype="category"), ["a", "b", "c", "d"]),
+        (
+            pd.to_datetime(
+                pd.Series(
+                    ["2020-01-01", "2020-01-02", "2020-01-01", "2020-01-03", "2020-01-02", "2020-01-01", None, "2020-01-03"]
+                )
+            ),
+            ["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"],
+        ),
+    ],
+)
+def test_pandas_data_same_column_splits(column: pd.Series, values: list):
+    data = pd.DataFrame({"col": column, "x": np.arange(8, dtype=float), "y": [0, 1] * 4})
+    data_splits = [
+        DataSplit(label=f"split_{i}", column_name="col", column_value=value) for i, value in enumerate(values)
+    ]
+    pandas_data = PandasData(data=data, data_splits=data_splits, dependent_vars=["y"])
+
+    # grouped path must not fall back to the per-split splitter
+    with patch.object(DataInterface, "split_data", side_effect=AssertionError):
+        splits = pandas_data.split_data()
+
+    for data_split in data_splits:
+        _, expected = DataSplitter.split(
+            split=data_split,
+            data=data,
+            data_type=AllowedDataType.PANDAS,
+            dependent_vars=["y"],
+        )
+        pd.testing.assert_frame_equal(splits[data_split.label].X, expected.X)
+        pd.testing.assert_frame_equal(splits[data_split.label].y, expected.y)
+
+    assert [len(splits[f"split_{i}"].X) for i in range(4)] == [3, 2, 2, 0]
+
+
+def test_pandas_data_mixed_splits_fall_back():
+    data = pd.DataFrame({"col": [1, 2, 1, 3], "x": [1.0, 2.0, 3.0, 4.0]})
+    data_splits = [
+        DataSplit(label="train", column_name="col", column_value=1),
+        DataSplit(label="test", column_name="col", column_value=2, start=2, stop=4),
+        DataSplit(label="val", column_name="col", column_value=3, indices=[0]),
+        DataSplit(label="holdout", column_name="col", column_value=3),
+    ]
+    pandas_data = PandasData(data=data, data_splits=data_splits)
+
+    splits = pandas_data.split_data()
+
+    for data_split in data_splits:
+        _, expected = DataSplitter.split(
+            split=data_split,
+            data=data,
+            data_type=AllowedDataType.PANDAS,
+            dependent_vars=[],
+        )
+        pd.testing.assert_frame_equal(splits[data_split.label].X, expected.X)
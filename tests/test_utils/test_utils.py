@@ -9,6 +9,7 @@ import pytest
 from google.oauth2.service_account import Credentials
 
 from opsml.helpers import exceptions, gcp_utils, utils
+from opsml.types import Description
 
 
 def test_experimental_feature() -> None:
@@ -119,6 +120,22 @@ def test_file_utils_find_filepath(tmp_path: Path) -> None:
         utils.FileUtils.find_filepath("test.txt", path=str(tmp_path))
 
 
+def test_description_reloads_edited_markdown(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    readme = tmp_path / "card_readme.md"
+
+    readme.write_text("first summary", encoding="utf-8")
+    assert Description(summary="card_readme.md").summary == "first summary"
+
+    readme.write_text("edited summary", encoding="utf-8")
+    assert Description(summary="card_readme.md").summary == "edited summary"
+
+    moved = tmp_path / "docs" / "card_readme.md"
+    moved.parent.mkdir()
+    readme.rename(moved)
+    assert Description(summary="card_readme.md").summary == "edited summary"
+
+
 def test_all_sublcasses() -> None:
     class A:
         pass